@@ -20,6 +20,7 @@ import operator
 from typing import List
 
 import llnl.util.filesystem as fs
+import llnl.util.tty as tty
 import llnl.util.tty.color as color
 
 import spack.util.executable
@@ -1674,6 +1675,10 @@ class ApplicationBase(metaclass=ApplicationMeta):
 
         exp_lock = self.experiment_lock()
 
+        # Messages logged for every line are only formatted when debugging,
+        # as they otherwise cost more than matching the line
+        debug = tty.is_debug()
+
         # Iterate over files. We already know they exist
         with lk.ReadTransaction(exp_lock):
             for file, file_conf in files.items():
@@ -1690,12 +1695,27 @@ class ApplicationBase(metaclass=ApplicationMeta):
                     criteria_list.find_criteria(c) for c in file_conf["success_criteria"]
                 ]
 
+                # FOMs sharing a regex (i.e. several groups of one line) only
+                # match it once per line. FOMs are still visited in their
+                # original order, so results are ordered as before.
+                fom_regexes = []
+                fom_order = []
+                regex_index = {}
+                for fom in file_conf["foms"]:
+                    fom_regex = foms[fom]["regex"]
+                    if fom_regex not in regex_index:
+                        regex_index[fom_regex] = len(fom_regexes)
+                        fom_regexes.append(fom_regex)
+                    fom_order.append((fom, regex_index[fom_regex]))
+
                 with open(file) as f:
                     for line in f.readlines():
-                        logger.debug(f"Line: {line}")
+                        if debug:
+                            logger.debug(f"Line: {line}")
                         new_per_file_crit_objs = []
                         for crit_obj in per_file_crit_objs:
-                            logger.debug(f"Looking for criteria {crit_obj.name}")
+                            if debug:
+                                logger.debug(f"Looking for criteria {crit_obj.name}")
                             if crit_obj.passed(line, self):
                                 crit_obj.mark_found()
                             elif crit_obj.anti_matched(line):
@@ -1720,12 +1740,14 @@ class ApplicationBase(metaclass=ApplicationMeta):
                                 if context_name not in fom_values:
                                     fom_values[context_name] = {}
 
-                        for fom in file_conf["foms"]:
-                            logger.debug(f"  Testing for fom {fom}")
-                            fom_conf = foms[fom]
-                            fom_match = fom_conf["regex"].match(line)
+                        fom_matches = [fom_regex.match(line) for fom_regex in fom_regexes]
+                        for fom, regex_idx in fom_order:
+                            if debug:
+                                logger.debug(f"  Testing for fom {fom}")
+                            fom_match = fom_matches[regex_idx]
 
                             if fom_match:
+                                fom_conf = foms[fom]
                                 fom_vars = {}
                                 for k, v in fom_match.groupdict().items():
                                     fom_vars[k] = v
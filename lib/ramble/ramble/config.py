@@ -139,6 +139,7 @@ config_defaults = {
         "connect_timeout": 10,
         "n_repeats": "0",
         "repeat_success_strict": True,
+        "sync_results": False,
         "verify_ssl": True,
         "checksum": True,
         "dirty": False,
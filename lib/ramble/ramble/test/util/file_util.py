@@ -0,0 +1,31 @@
+# Copyright 2022-2025 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the util/file_util functions"""
+
+import os
+
+from ramble.util.file_util import create_symlink
+
+
+def test_create_symlink_replaces_link(tmpdir):
+    with tmpdir.as_cwd():
+        for name in ["results.1.txt", "results.2.txt"]:
+            with open(name, "w") as f:
+                f.write(name)
+
+        create_symlink("results.1.txt", "results.latest.txt")
+        assert os.readlink("results.latest.txt") == "results.1.txt"
+
+        create_symlink("results.2.txt", "results.latest.txt")
+        assert os.readlink("results.latest.txt") == "results.2.txt"
+
+        # A temporary link left by an interrupted update is replaced
+        os.symlink("results.1.txt", ".results.latest.txt.tmp")
+        create_symlink("results.1.txt", "results.latest.txt")
+        assert os.readlink("results.latest.txt") == "results.1.txt"
+        assert sorted(os.listdir(".")) == ["results.1.txt", "results.2.txt", "results.latest.txt"]
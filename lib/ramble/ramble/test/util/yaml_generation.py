@@ -106,3 +106,18 @@ def test_remove_config_value(yaml_config):
     ramble.util.yaml_generation.remove_config_value(read_data, "bar.bar_str")
     assert "bar_str" not in read_data["bar"]
     assert "bar2" in read_data["bar"]
+
+
+def test_read_config_file_cached_copies(tmpdir):
+    path = str(tmpdir.join("config.yaml"))
+    with open(path, "w+") as f:
+        f.write("foo:\n  bar: 1\n")
+
+    first = ramble.util.yaml_generation.read_config_file(path)
+    first["foo"]["bar"] = 2
+    assert ramble.util.yaml_generation.read_config_file(path)["foo"]["bar"] == 1
+
+    # Changes to the file are picked up
+    with open(path, "w+") as f:
+        f.write("foo:\n  bar: 10\n")
+    assert ramble.util.yaml_generation.read_config_file(path)["foo"]["bar"] == 10
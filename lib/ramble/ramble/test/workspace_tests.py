@@ -11,6 +11,7 @@ import os
 import pytest
 
 import ramble.workspace
+import spack.util.spack_json as sjson
 
 # everything here uses the mock_workspace_path
 pytestmark = pytest.mark.usefixtures(
@@ -30,3 +31,283 @@ def test_re_read(tmpdir):
         test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
         test_workspace.clear()
         test_workspace._re_read()
+
+
+def test_software_dict_reused_until_config_changes(tmpdir):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd())
+        ws.write()
+
+        with ws:
+            first = ws.get_software_dict()
+            assert ws.get_software_dict() is first
+
+            ws.manage_packages("test_pkg", pkg_spec="test_pkg@1.0")
+            updated = ws.get_software_dict()
+            assert updated is not first
+            assert "test_pkg" in updated["packages"]
+
+
+def test_contexts_reused_until_config_changes(tmpdir):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd())
+        ws.write()
+
+        with ws:
+            ws.add_experiments("basic", None, ["test_wl"], False, [], ["n_nodes=1"], "exp1")
+
+            def contexts():
+                return [context for _, context in ws.all_applications()]
+
+            first = contexts()
+            assert [context.context_name for context in first] == ["basic"]
+            assert contexts()[0] is first[0]
+
+            ws.add_experiments("basic", None, ["test_wl"], False, [], ["n_nodes=2"], "exp2")
+            assert contexts()[0] is not first[0]
+
+
+def test_included_config_edits_picked_up(tmpdir):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd())
+        ws.write()
+
+        included_path = os.path.join(ws.root, "variables.yaml")
+        with open(included_path, "w+") as f:
+            f.write("variables:\n  test_var: '1'\n")
+        with open(ws.config_file_path, "a") as f:
+            f.write("  include:\n")
+            f.write(f"  - {included_path}\n")
+        ws._re_read()
+
+        def included_variables():
+            (scope,) = ws.included_config_scopes()
+            return scope.get_section("variables")["variables"]
+
+        assert included_variables()["test_var"] == "1"
+
+        # Editing only the included file must not serve stale data
+        with open(included_path, "w+") as f:
+            f.write("variables:\n  test_var: '2'\n")
+        assert included_variables()["test_var"] == "2"
+
+
+def test_included_config_env_var_changes_picked_up(tmpdir, monkeypatch):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd())
+        ws.write()
+
+        for name, value in (("first", "1"), ("second", "2")):
+            with open(os.path.join(ws.root, f"{name}.yaml"), "w+") as f:
+                f.write(f"variables:\n  test_var: '{value}'\n")
+
+        monkeypatch.setenv("RAMBLE_TEST_INCLUDE", "first")
+        with open(ws.config_file_path, "a") as f:
+            f.write("  include:\n")
+            f.write(f"  - {ws.root}/$RAMBLE_TEST_INCLUDE.yaml\n")
+        ws._re_read()
+
+        def included_variables():
+            (scope,) = ws.included_config_scopes()
+            return scope.get_section("variables")["variables"]
+
+        assert included_variables()["test_var"] == "1"
+
+        monkeypatch.setenv("RAMBLE_TEST_INCLUDE", "second")
+        assert included_variables()["test_var"] == "2"
+
+
+@pytest.mark.parametrize(
+    "patterns,name,expected",
+    [
+        (["*"], "anything", True),
+        (["ser*", "local"], "serial", True),
+        (["ser*", "local"], "local_bg", False),
+        (["n_?odes"], "n_nodes", True),
+        ([], "serial", False),
+    ],
+)
+def test_compile_glob_filters(patterns, name, expected):
+    from ramble.workspace.workspace import _compile_glob_filters
+
+    assert bool(_compile_glob_filters(patterns).match(name)) == expected
+
+
+def test_insert_result_ordering(tmpdir):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd(), True)
+
+        for name in ["a.1", "a.2", "b.1", "b.2"]:
+            ws.append_result({"name": name})
+        ws.insert_result({"name": "a"}, "a.1")
+        ws.insert_result({"name": "b"}, "b.1")
+        ws.insert_result({"name": "c"}, "c.1")
+
+        names = [exp["name"] for exp in ws.results["experiments"]]
+        assert names == ["a", "a.1", "a.2", "b", "b.1", "b.2", "c"]
+
+        # Replacing the results entirely should not use stale positions
+        ws.results = ws.default_results()
+        ws.append_result({"name": "d.1"})
+        ws.insert_result({"name": "d"}, "d.1")
+        assert [exp["name"] for exp in ws.results["experiments"]] == ["d", "d.1"]
+
+
+def test_write_tmp_and_replace(tmpdir):
+    from ramble.workspace.workspace import _write_tmp_and_replace
+
+    out_file = os.path.join(str(tmpdir), "results.txt")
+    with open(out_file, "w") as f:
+        f.write("old")
+
+    with pytest.raises(ValueError):
+        with _write_tmp_and_replace(out_file) as f:
+            f.write("partial")
+            raise ValueError("interrupted")
+
+    # A failed write leaves the original file untouched, and no temporary file
+    with open(out_file) as f:
+        assert f.read() == "old"
+    assert os.listdir(str(tmpdir)) == ["results.txt"]
+
+    with _write_tmp_and_replace(out_file) as f:
+        f.write("new")
+
+    with open(out_file) as f:
+        assert f.read() == "new"
+    assert os.listdir(str(tmpdir)) == ["results.txt"]
+
+
+def test_latest_archive_skips_links_and_files(tmpdir):
+    with tmpdir.as_cwd():
+        ws = ramble.workspace.Workspace(os.getcwd(), True)
+
+        os.makedirs(os.path.join(ws.archive_dir, "old"))
+        os.makedirs(os.path.join(ws.archive_dir, "new"))
+        os.utime(os.path.join(ws.archive_dir, "old"), (1000, 1000))
+        os.utime(os.path.join(ws.archive_dir, "new"), (2000, 2000))
+        os.symlink(os.path.join(ws.archive_dir, "new"), os.path.join(ws.archive_dir, "link"))
+        with open(os.path.join(ws.archive_dir, "file.tar.gz"), "w") as f:
+            f.write("")
+
+        assert ws.latest_archive == "new"
+        assert ws.latest_archive_path == os.path.join(ws.archive_dir, "new")
+
+
+def test_yaml_equivalent_dicts():
+    import spack.util.spack_yaml as syaml
+    from ramble.workspace.workspace import yaml_equivalent
+
+    override_key = syaml.syaml_str("a")
+    override_key.override = True
+
+    assert yaml_equivalent({"a": {"b": ["c"]}, "d": "e"}, {"a": {"b": ["c"]}, "d": "e"})
+    assert not yaml_equivalent({"a": "b", "c": "d"}, {"c": "d", "a": "b"})
+    assert not yaml_equivalent({"a": {"b": ["c"]}}, {"a": {"b": ["d"]}})
+    assert not yaml_equivalent({"a": "b"}, {override_key: "b"})
+
+
+def test_prune_config_path():
+    from ramble.workspace.workspace import _prune_config_path
+
+    config = {"app": {"workloads": {"wl": {"experiments": {"a": {}, "b": {}}}}}}
+
+    _prune_config_path(config, ["app", "workloads", "wl", "experiments", "a"])
+    assert config == {"app": {"workloads": {"wl": {"experiments": {"b": {}}}}}}
+
+    _prune_config_path(config, ["app", "workloads", "wl", "experiments", "b"])
+    assert config == {}
+
+    with pytest.raises(KeyError):
+        _prune_config_path(config, ["app", "workloads", "wl", "experiments", "b"])
+
+
+@pytest.mark.parametrize("root", ["/path/to/ws", "/path/to/ws/", "ws"])
+def test_get_workspace_paths(root):
+    paths = ramble.workspace.Workspace.get_workspace_paths(root)
+
+    assert paths["workspace_root"] == root
+    assert paths["workspace"] == root
+    assert paths["workspace_configs"] == os.path.join(root, "configs")
+    assert paths["workspace_software"] == os.path.join(root, "software")
+    assert paths["workspace_logs"] == os.path.join(root, "logs")
+    assert paths["workspace_inputs"] == os.path.join(root, "inputs")
+    assert paths["workspace_experiments"] == os.path.join(root, "experiments")
+    assert paths["workspace_shared"] == os.path.join(root, "shared")
+    assert paths["workspace_archives"] == os.path.join(root, "archive")
+    assert paths["workspace_deployments"] == os.path.join(root, "deployments")
+
+
+def test_sync_files(tmpdir, monkeypatch):
+    from ramble.workspace.workspace import _sync_files
+
+    filenames = [str(tmpdir.join(name)) for name in ["results.txt", "results.json"]]
+    for filename in filenames:
+        with open(filename, "w") as f:
+            f.write("results\n")
+
+    opened = {}
+    synced = []
+    os_open = os.open
+
+    def record_open(path, flags):
+        fd = os_open(path, flags)
+        opened[fd] = path
+        return fd
+
+    monkeypatch.setattr(os, "open", record_open)
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(opened[fd]))
+    _sync_files(filenames)
+
+    assert synced == filenames + [str(tmpdir)]
+
+
+def test_write_json_results(tmpdir):
+    import ramble.workspace.workspace as workspace_module
+
+    results = {
+        "workspace_name": "test",
+        "experiments": [
+            {
+                "name": "app.wl.exp",
+                "N_REPEATS": 0,
+                "CONTEXTS": [
+                    {
+                        "display_name": "null",
+                        "foms": [
+                            {"name": "time", "value": 1.5, "units": "\u00b5s"},
+                            {"name": "rate", "value": float("nan"), "units": "s"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+    out_file = str(tmpdir.join("results.json"))
+
+    workspace_module._write_json_results(results, out_file)
+
+    # NaN and non-ASCII units must be written exactly as spack_json writes them
+    expected = sjson.dump(results)
+    assert "NaN" in expected
+    assert "\\u00b5s" in expected
+    with open(out_file, "rb") as f:
+        assert f.read() == expected.encode()
+
+
+def test_filter_results_preserves_workspace_results():
+    from ramble.workspace.workspace import _filter_results
+
+    summary = {"name": "exp", "N_REPEATS": 2}
+    repeat = {"name": "exp.1", "N_REPEATS": 0}
+    results = {"workspace_name": "test", "experiments": [summary, repeat]}
+
+    assert _filter_results(results, summary_only=False) is results
+
+    filtered = _filter_results(results, summary_only=True)
+    assert filtered["experiments"] == [summary]
+    assert filtered["experiments"][0] is summary
+    assert results["experiments"] == [summary, repeat]
+
+    summaries = {"experiments": [summary]}
+    assert _filter_results(summaries, summary_only=True) is summaries
@@ -35,8 +35,16 @@ def is_dry_run_path(path: str) -> bool:
 def create_symlink(base, link):
     """
     Create symlink of a file to give a known and predictable path
-    """
-    if os.path.islink(link):
-        os.unlink(link)
 
-    os.symlink(base, link)
+    The symlink is created under a temporary name and moved over any existing
+    link, so the link is replaced atomically.
+    """
+    tmp_link = os.path.join(os.path.dirname(link), f".{os.path.basename(link)}.tmp")
+    try:
+        os.symlink(base, tmp_link)
+    except FileExistsError:
+        # Left behind by an interrupted update
+        os.unlink(tmp_link)
+        os.symlink(base, tmp_link)
+
+    os.replace(tmp_link, link)
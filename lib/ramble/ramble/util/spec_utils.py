@@ -6,6 +6,9 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+#: Spec attributes which are ignored when comparing specs
+_equiv_ignored_keys = frozenset(["application_name", "spec_type", "package_manager"])
+
 
 def specs_equiv(spec1, spec2):
     all_keys = set()
@@ -16,14 +19,7 @@ def specs_equiv(spec1, spec2):
         if spec2[key] is not None:
             all_keys.add(key)
 
-    if "application_name" in all_keys:
-        all_keys.remove("application_name")
-
-    if "spec_type" in all_keys:
-        all_keys.remove("spec_type")
-
-    if "package_manager" in all_keys:
-        all_keys.remove("package_manager")
+    all_keys -= _equiv_ignored_keys
 
     for key in all_keys:
         if key not in spec1:
@@ -34,3 +30,22 @@ def specs_equiv(spec1, spec2):
             return False
 
     return True
+
+
+def spec_equiv_key(spec):
+    """Build a hashable key representing a spec for equivalence checks
+
+    Two specs with hashable attribute values are equivalent (as determined by
+    specs_equiv) if and only if their keys compare equal.
+
+    Args:
+        spec (dict): Spec definition to build a key for
+
+    Returns:
+        (frozenset): Set of (attribute, value) pairs that define the spec
+    """
+    return frozenset(
+        (key, val)
+        for key, val in spec.items()
+        if val is not None and key not in _equiv_ignored_keys
+    )
@@ -25,6 +25,9 @@ Would translate to `foo.bar.baz = 1.0` in Ramble syntax.
 
 """
 
+import copy
+import functools
+import os
 from typing import Dict, Any
 import ruamel.yaml as yaml
 import spack.util.spack_yaml as syaml
@@ -32,14 +35,12 @@ import spack.util.spack_yaml as syaml
 from ramble.util.logger import logger
 
 
-def read_config_file(conf_path: str):
-    """Read an existing YAML file and return its data as a dictionary
-
-    Args:
-        conf_path (str): Path to input configuration file to read
+@functools.lru_cache(maxsize=32)
+def _load_config_file(conf_path: str, mtime_ns: int, size: int):
+    """Parse a YAML file, caching the result
 
-    Returns:
-        (dict): Dictionary representation of the data contained in conf_path
+    The modification time and size are part of the cache key, so a file
+    that changes on disk is parsed again.
     """
     with open(conf_path) as base_conf:
         logger.debug(f"Reading config from {conf_path}")
@@ -51,6 +52,22 @@ def read_config_file(conf_path: str):
     return config_dict
 
 
+def read_config_file(conf_path: str):
+    """Read an existing YAML file and return its data as a dictionary
+
+    Experiments sharing a base config only parse it once. Each call
+    returns its own copy, so callers are free to modify it.
+
+    Args:
+        conf_path (str): Path to input configuration file to read
+
+    Returns:
+        (dict): Dictionary representation of the data contained in conf_path
+    """
+    conf_stat = os.stat(conf_path)
+    return copy.deepcopy(_load_config_file(conf_path, conf_stat.st_mtime_ns, conf_stat.st_size))
+
+
 def all_config_options(config_data: Dict):
     """Extract all config options from config_data dictionary
 
@@ -73,7 +90,7 @@ def all_config_options(config_data: Dict):
             for level in cur_part[1]:
                 option_parts.insert(0, (f"{cur_part[0]}.{level}", cur_part[1][level]))
         else:
-            if len(cur_part[0].split(".")) > 1:
+            if "." in cur_part[0]:
                 all_configs.add(cur_part[0])
 
     return all_configs
@@ -219,7 +236,7 @@ def apply_default_config_values(config_data, app_inst, default_config_string):
 
     # Set all '{default_config_value}' values to value from the base config
     for var_name in workload.variables.keys():
-        if len(var_name.split(".")) > 1:
+        if "." in var_name:
             var_val = app_inst.expander.expand_var(app_inst.expander.expansion_str(var_name))
 
             if var_val == default_config_string:
@@ -8,6 +8,7 @@
 
 import os
 import contextlib
+import stat
 import copy
 import re
 import shutil
@@ -26,18 +27,12 @@ import ramble.error
 import ramble.repository
 import ramble.experiment_set
 import ramble.context
-import ramble.util.web
-import ramble.fetch_strategy
 import ramble.util.install_cache
 import ramble.success_criteria
 import ramble.keywords
-import ramble.software_environments
-from ramble.mirror import MirrorStats
 
 import spack.util.spack_yaml as syaml
 import spack.util.spack_json as sjson
-import spack.util.url as url_util
-import spack.util.web as web_util
 
 import ramble.schema.workspace
 import ramble.schema.applications
@@ -45,7 +40,7 @@ import ramble.schema.merged
 
 import ramble.util.lock as lk
 from ramble.util.path import substitute_path_variables
-from ramble.util.spec_utils import specs_equiv
+from ramble.util.spec_utils import specs_equiv, spec_equiv_key
 import ramble.util.hashing
 from ramble.namespace import namespace
 import ramble.util.matrices
@@ -88,6 +83,18 @@ workspace_shared_license_path = "licenses"
 #: Name of the subdirectory where deployments are stored
 workspace_deployments_path = "deployments"
 
+#: Workspace path keywords, and the subdirectories they refer to
+_workspace_subdir_keywords = (
+    ("workspace_configs", workspace_config_path),
+    ("workspace_software", workspace_software_path),
+    ("workspace_logs", workspace_log_path),
+    ("workspace_inputs", workspace_input_path),
+    ("workspace_experiments", workspace_experiment_path),
+    ("workspace_shared", workspace_shared_path),
+    ("workspace_archives", workspace_archive_path),
+    ("workspace_deployments", workspace_deployments_path),
+)
+
 #: regex for validating workspace names
 valid_workspace_name_re = r"^\w[\w-]*$"
 
@@ -116,6 +123,9 @@ workspace_execution_template = "execute_experiment" + workspace_template_extensi
 #: Name of lockfile within a workspace
 lockfile_name = "ramble.lock"
 
+#: Buffer size used when streaming results to a file
+_results_write_buffer_size = 1 << 20
+
 
 def valid_workspace_name(name):
     return re.match(valid_workspace_name_re, name)
@@ -415,9 +425,53 @@ class Workspace:
     inventory_file_name = "ramble_inventory.json"
     hash_file_name = "workspace_hash.sha256"
 
+    __slots__ = (
+        "root",
+        "_path_cache",
+        "txlock",
+        "dry_run",
+        "repeat_success_strict",
+        "read_default_template",
+        "configs",
+        "_templates",
+        "_auxiliary_software_files",
+        "software_mirror_path",
+        "input_mirror_path",
+        "mirror_existed",
+        "mirror_path",
+        "software_mirror_stats",
+        "input_mirror_stats",
+        "input_mirror_cache",
+        "software_mirror_cache",
+        "software_environments",
+        "spack_cache_path",
+        "_software_dict_cache",
+        "_context_cache",
+        "_context_cache_source",
+        "metadata",
+        "hash_inventory",
+        "workspace_hash",
+        "specs",
+        "config_sections",
+        "install_cache",
+        "pkg_path_cache",
+        "results",
+        "_results_index",
+        "success_list",
+        "application_configs",
+        "experiments_script",
+        "logger",
+        "deployment_name",
+        "_previous_active",
+        "_latest_archive",
+        "_workspace_path_replacements",
+    )
+
     def __init__(self, root, dry_run=False, read_default_template=True):
         logger.debug(f"In workspace init. Root = {root}")
         self.root = ramble.util.path.canonicalize_path(root)
+        # Paths derived from root, which never changes for a workspace
+        self._path_cache = {}
         self.txlock = lk.Lock(self._transaction_lock_path)
         self.dry_run = dry_run
         self.repeat_success_strict = True
@@ -434,6 +488,9 @@ class Workspace:
         self.input_mirror_cache = None
         self.software_mirror_cache = None
         self.software_environments = None
+        self._software_dict_cache = None
+        self._context_cache = {}
+        self._context_cache_source = None
         self.metadata = syaml.syaml_dict()
         self.hash_inventory = {"experiments": [], "versions": []}
         version = ramble.util.version.get_version()
@@ -458,6 +515,8 @@ class Workspace:
         self.pkg_path_cache = defaultdict(dict)
 
         self.results = self.default_results()
+        # Maps experiment names to their position in self.results["experiments"]
+        self._results_index = {}
 
         self.success_list = ramble.success_criteria.ScopedCriteriaList()
 
@@ -776,6 +835,9 @@ ramble:
         self.application_configs = []
         self._previous_active = None  # previously active environment
         self.specs = []
+        self._software_dict_cache = None
+        self._context_cache = {}
+        self._context_cache_source = None
 
     def extract_success_criteria(self, scope, contents):
         """Extract success citeria, and inject it into the scoped list
@@ -803,9 +865,26 @@ ramble:
 
         return specs
 
+    def _cached_path(self, name, base, part):
+        """Join a workspace path once, and reuse it on later accesses
+
+        Args:
+            name (str): Name to cache the path under
+            base (str): Directory the path is relative to
+            part (str): Path relative to base
+
+        Returns:
+            (str): The joined path
+        """
+        path = self._path_cache.get(name)
+        if path is None:
+            path = os.path.join(base, part)
+            self._path_cache[name] = path
+        return path
+
     @property
     def all_experiments_path(self):
-        return os.path.join(self.root, workspace_all_experiments_file)
+        return self._cached_path("all_experiments_path", self.root, workspace_all_experiments_file)
 
     def build_experiment_set(self):
         """Create an experiment set representing this workspace"""
@@ -827,6 +906,27 @@ ramble:
 
         return experiment_set
 
+    def _context_from_dict(self, context_name, contents):
+        """Get the context for a config section, reusing a previously created
+        context while the section's contents are the same object
+
+        Args:
+            context_name (str): Name of the context
+            contents (dict): Config section to create the context from
+
+        Returns:
+            (Context): Context representing contents
+        """
+        key = (context_name, id(contents))
+        cached = self._context_cache.get(key)
+        # The cache holds a reference to contents, so its id cannot be reused
+        if cached is not None and cached[0] is contents:
+            return cached[1]
+
+        context = ramble.context.create_context_from_dict(context_name, contents)
+        self._context_cache[key] = (contents, context)
+        return context
+
     def all_applications(self):
         """Iterator over applications
 
@@ -835,14 +935,19 @@ ramble:
         should be applied.
         """
 
-        ws_dict = self._get_workspace_dict()
-        logger.debug(f" With ws dict: {ws_dict}")
+        if tty.is_debug():
+            logger.debug(f" With ws dict: {self._get_workspace_dict()}")
 
         # Iterate over applications in ramble.yaml first
         app_dict = ramble.config.config.get_config("applications")
 
+        # Contexts are reused until the application config is regenerated
+        if app_dict is not self._context_cache_source:
+            self._context_cache = {}
+            self._context_cache_source = app_dict
+
         for application, contents in app_dict.items():
-            application_context = ramble.context.create_context_from_dict(application, contents)
+            application_context = self._context_from_dict(application, contents)
 
             self.extract_success_criteria("application", contents)
 
@@ -857,9 +962,7 @@ ramble:
                 logger.msg(f"No applications in config file {app_conf}")
             app_dict = config[namespace.application]
             for application, contents in app_dict.items():
-                application_context = ramble.context.create_context_from_dict(
-                    application, contents
-                )
+                application_context = self._context_from_dict(application, contents)
 
                 self.extract_success_criteria("application", contents)
 
@@ -880,7 +983,7 @@ ramble:
         workloads = application[namespace.workload]
 
         for workload, contents in workloads.items():
-            workload_context = ramble.context.create_context_from_dict(workload, contents)
+            workload_context = self._context_from_dict(workload, contents)
 
             self.extract_success_criteria("workload", contents)
 
@@ -900,7 +1003,7 @@ ramble:
 
         experiments = workload[namespace.experiment]
         for experiment, contents in experiments.items():
-            experiment_context = ramble.context.create_context_from_dict(experiment, contents)
+            experiment_context = self._context_from_dict(experiment, contents)
 
             self.extract_success_criteria("experiment", contents)
 
@@ -970,14 +1073,13 @@ ramble:
                         "external environments without --overwrite"
                     )
 
-            if env_name not in environments:
-                environments[env_name] = syaml.syaml_dict()
+            env_entry = environments.setdefault(env_name, syaml.syaml_dict())
 
             if package_list:
-                environments[env_name][namespace.packages] = package_list.copy()
+                env_entry[namespace.packages] = package_list
 
             elif external_path:
-                environments[env_name][namespace.external_env] = external_path
+                env_entry[namespace.external_env] = external_path
 
         if not self.dry_run:
             ramble.config.config.update_config(
@@ -1108,53 +1210,6 @@ ramble:
         if zips is None:
             zips = []
 
-        def yaml_add_comment_before_key(
-            base, key, comment, column=None, clear=False, start_char="#"
-        ):
-            """
-            Insert a comment before the provided key within the base commented
-            object.
-
-            Args:
-                base: Typically a CommentedMap, but the object comments should
-                      be added to
-                key: Key in base object to inject the comment before.
-                column (int): Column to start the comment at. If not specified,
-                              will use previously defined comments to determine
-                              indentation.
-                clear (bool): Whether to clear previous comments or not
-                start_char (str): Character to begin the comment with
-            """
-            import ruamel.yaml as yaml
-
-            key_comment = base.ca.items.setdefault(key, [None, [], None, None])
-
-            if clear:
-                key_comment[1] = []
-            comment_list = key_comment[1]
-
-            if comment:
-                comment_start = f"{start_char} "
-                if comment[-1] == "\n":
-                    comment = comment[:-1]  # strip final newline if there
-            else:
-                comment_start = f"{start_char}"
-
-            if column is None:
-                if comment_list:
-                    # if there already are other comments get the column from them
-                    column = comment_list[-1].start_mark.column
-                else:
-                    column = 0
-
-            start_mark = yaml.error.Mark(None, None, None, column, None, None)
-
-            comment_list.append(
-                yaml.tokens.CommentToken(comment_start + comment + "\n", start_mark, None)
-            )
-
-            return base
-
         import ruamel.yaml as yaml
 
         edited = False
@@ -1165,32 +1220,24 @@ ramble:
         app_inst = ramble.repository.get(application)
 
         var_def_dict = {}
-        def_regex = re.compile(r"(?P<key>.*)=(?P<value>.*)")
         for definition in variable_definitions:
-            m = def_regex.match(definition)
-            if m:
-                key = m.group("key")
-                value = list_str_to_list(m.group("value"))
-                var_def_dict[key] = value
+            key, sep, value = definition.partition("=")
+            if sep:
+                var_def_dict[key] = list_str_to_list(value)
             else:
                 logger.die(
                     f"Invalid variable definition provided: {definition}. "
                     + "Accepted form is 'key=value'"
                 )
 
-        if application not in apps_dict:
-            apps_dict[application] = syaml.syaml_dict()
-            apps_dict[application][namespace.workload] = syaml.syaml_dict()
-
-        workloads_dict = apps_dict[application][namespace.workload]
+        app_dict = apps_dict.setdefault(application, syaml.syaml_dict())
+        workloads_dict = app_dict.setdefault(namespace.workload, syaml.syaml_dict())
 
         exp_zips = {}
         for zip_def in zips:
-            m = def_regex.match(zip_def)
-            if m:
-                key = m.group("key")
-                value = list_str_to_list(m.group("value"))
-                exp_zips[key] = value
+            key, sep, value = zip_def.partition("=")
+            if sep:
+                exp_zips[key] = list_str_to_list(value)
             else:
                 logger.die(
                     f"Invalid zip definition provided: {zip_def}. "
@@ -1202,108 +1249,106 @@ ramble:
             for part in matrix.split(","):
                 exp_matrix.append(part)
 
+        workload_filter_re = _compile_glob_filters(workload_filters)
+        variable_filter_re = _compile_glob_filters(variable_filters)
+
+        app_workloads = app_inst.workloads
+
         workload_names = []
-        for workload in app_inst.workloads.values():
-            add_workload = False
-            for wl_filter in workload_filters:
-                if fnmatch.fnmatch(workload.name, wl_filter):
-                    add_workload = True
-                    break
+        for workload in app_workloads.values():
+            workload_name = workload.name
+            if not workload_filter_re.match(workload_name):
+                continue
 
             # Don't add this experiment if it already exists in the workspace
-            if add_workload:
-                if application in apps_dict:
-                    subdict = apps_dict[application]
-                    if namespace.workload in subdict:
-                        subdict = subdict[namespace.workload]
-                        if workload.name in subdict:
-                            subdict = subdict[workload.name]
-                            if namespace.experiment in subdict:
-                                subdict = subdict[namespace.experiment]
-                                if experiment_name in subdict:
-                                    exp_name = f"{application}.{workload.name}.{experiment_name}"
-                                    if not overwrite:
-                                        logger.warn(
-                                            f"Experiment {exp_name} is defined already. "
-                                            + "To overwrite, use '--overwrite'"
-                                        )
-                                    add_workload = overwrite
-
-            if add_workload:
-                workload_names.append(workload.name)
+            existing_exps = workloads_dict.get(workload_name, {}).get(namespace.experiment, {})
+            if experiment_name in existing_exps:
+                if not overwrite:
+                    exp_name = f"{application}.{workload_name}.{experiment_name}"
+                    logger.warn(
+                        f"Experiment {exp_name} is defined already. "
+                        + "To overwrite, use '--overwrite'"
+                    )
+                    continue
+
+            workload_names.append(workload_name)
 
         if workload_name_variable:
-            var_def_dict[workload_name_variable] = workload_names.copy()
+            var_def_dict[workload_name_variable] = workload_names
             workload_names = [ramble.expander.Expander.expansion_str(workload_name_variable)]
 
+        # Required variables which are not already defined by the workspace
+        missing_required_vars = [
+            key for key in app_inst.keywords.all_required_keys() if key not in workspace_vars
+        ]
+
         for workload_name in workload_names:
             edited = True
-            if workload_name not in workloads_dict:
-                workloads_dict[workload_name] = syaml.syaml_dict()
-                workloads_dict[workload_name][namespace.experiment] = syaml.syaml_dict()
-
-            exps_dict = workloads_dict[workload_name][namespace.experiment]
-            exps_dict[experiment_name] = syaml.syaml_dict()
+            workload_dict = workloads_dict.setdefault(workload_name, syaml.syaml_dict())
+            exps_dict = workload_dict.setdefault(namespace.experiment, syaml.syaml_dict())
+            exps_dict[experiment_name] = {}
             exp_dict = exps_dict[experiment_name]
 
             if package_manager is not None:
-                exp_dict[namespace.variants] = syaml.syaml_dict()
+                exp_dict[namespace.variants] = {}
                 variants_dict = exp_dict[namespace.variants]
                 variants_dict[namespace.package_manager] = package_manager
 
-            if namespace.variables not in exp_dict:
-                exp_dict[namespace.variables] = yaml.comments.CommentedMap()
-
-            vars_dict = exp_dict[namespace.variables]
+            vars_dict = exp_dict.setdefault(namespace.variables, yaml.comments.CommentedMap())
 
             # Ensure required variables are defined
-            for key in app_inst.keywords.all_required_keys():
-                if key not in workspace_vars:
-                    vars_dict[key] = ""
+            for key in missing_required_vars:
+                vars_dict[key] = ""
 
             # Only extract variable defaults if requested.
             # This is mutually exclusive with workload_name_variable
             if include_default_variables:
                 # At this point we should only have a valid workload name
-                workload = app_inst.workloads[workload_name]
+                workload = app_workloads[workload_name]
                 if workload.variables:
+                    # Each variable gets a single (possibly multi-line)
+                    # comment token, with continuation lines indented to
+                    # the comment column.
+                    comment_column = 17
+                    comment_sep = "\n" + " " * comment_column
+                    comment_mark = yaml.error.Mark(None, None, None, comment_column, None, None)
                     first_var = True
+                    vars_comments = vars_dict.ca.items
                     for var in workload.variables.values():
-                        keep_var = False
-                        for var_filter in variable_filters:
-                            if fnmatch.fnmatch(var.name, var_filter):
-                                keep_var = True
-                                break
-
-                        if keep_var:
-                            vars_dict[var.name] = var.default
-
-                            # Add blank line before all variables except
-                            # the first
-                            if first_var:
-                                first_var = False
-                            else:
-                                yaml_add_comment_before_key(
-                                    vars_dict, var.name, "", column=17, start_char=""
-                                )
-                            if var.description:
-                                yaml_add_comment_before_key(
-                                    vars_dict, var.name, var.description, column=17
-                                )
-                            if len(var.values) > 1 or var.values[0] is not None:
-                                yaml_add_comment_before_key(
-                                    vars_dict,
-                                    var.name,
-                                    f"Suggested values: {var.values}",
-                                    column=17,
+                        var_name = var.name
+                        if not variable_filter_re.match(var_name):
+                            continue
+
+                        vars_dict[var_name] = var.default
+
+                        comment_lines = []
+                        # Add blank line before all variables except
+                        # the first
+                        if first_var:
+                            first_var = False
+                        else:
+                            comment_lines.append("")
+                        if var.description:
+                            description = var.description
+                            if description[-1] == "\n":
+                                description = description[:-1]
+                            comment_lines.append(f"# {description}")
+                        if len(var.values) > 1 or var.values[0] is not None:
+                            comment_lines.append(f"# Suggested values: {var.values}")
+
+                        if comment_lines:
+                            key_comment = vars_comments.setdefault(
+                                var_name, [None, [], None, None]
+                            )
+                            key_comment[1].append(
+                                yaml.tokens.CommentToken(
+                                    comment_sep.join(comment_lines) + "\n", comment_mark, None
                                 )
+                            )
 
                 if workload.environment_variables:
-                    if namespace.env_var not in exps_dict[experiment_name]:
-                        exp_dict[namespace.env_var] = syaml.syaml_dict()
-                        exp_dict[namespace.env_var]["set"] = syaml.syaml_dict()
-
-                    env_vars_dict = exp_dict[namespace.env_var]["set"]
+                    env_var_dict = exp_dict.setdefault(namespace.env_var, {})
+                    env_vars_dict = env_var_dict.setdefault("set", {})
 
                     for env_var in workload.environment_variables.values():
                         env_vars_dict[env_var.name] = env_var.value
@@ -1340,18 +1385,20 @@ ramble:
 
 
         """
+        import ramble.software_environments
+
         full_software_dict = self.get_software_dict()
 
         if (
             namespace.packages not in full_software_dict
             or not full_software_dict[namespace.packages]
         ):
-            full_software_dict[namespace.packages] = syaml.syaml_dict()
+            full_software_dict[namespace.packages] = {}
         if (
             namespace.environments not in full_software_dict
             or not full_software_dict[namespace.environments]
         ):
-            full_software_dict[namespace.environments] = syaml.syaml_dict()
+            full_software_dict[namespace.environments] = {}
 
         packages_dict = full_software_dict[namespace.packages]
         environments_dict = full_software_dict[namespace.environments]
@@ -1360,51 +1407,56 @@ ramble:
 
         experiment_set = self.build_experiment_set()
 
-        for _, app_inst, _ in experiment_set.all_experiments():
-            app_inst.build_modifier_instances()
-            env_name_str = app_inst.expander.expansion_str(ramble.keywords.keywords.env_name)
-            env_name = app_inst.expander.expand_var(env_name_str)
+        # Package manager patterns and software definitions repeat across
+        # experiments, so each unique combination is only evaluated once.
+        pm_matches = {}
+        verified_specs = set()
+
+        def pm_match(pm_name, pattern):
+            key = (pm_name, pattern)
+            if key not in pm_matches:
+                pm_matches[key] = fnmatch.fnmatch(pm_name, pattern)
+            return pm_matches[key]
+
+        def defined_equivalently(name, info):
+            # Existing definitions are not modified unless force is set, in
+            # which case they are never compared.
+            key = (name, spec_equiv_key(info))
+            if key in verified_specs:
+                return True
+            if specs_equiv(info, packages_dict[name]):
+                verified_specs.add(key)
+                return True
+            return False
+
+        def define_package(name, info, kind):
+            if name not in packages_dict or force:
+                pkg_def = {}
+                pkg_def["pkg_spec"] = info["pkg_spec"]
+                if "compiler_spec" in info and info["compiler_spec"]:
+                    pkg_def["compiler_spec"] = info["compiler_spec"]
+                if "compiler" in info and info["compiler"]:
+                    pkg_def["compiler"] = info["compiler"]
+                packages_dict[name] = pkg_def
+            elif not quiet and not defined_equivalently(name, info):
+                logger.debug(f"  Spec 1: {str(info)}")
+                logger.debug(f"  Spec 2: {str(packages_dict[name])}")
+                raise RambleConflictingDefinitionError(
+                    f"{kind} {name} would be defined in multiple conflicting ways"
+                )
 
+        # Software is extracted from each experiment independently, and then
+        # merged serially so conflicts are detected in experiment order.
+        for _, app_inst, _ in experiment_set.all_experiments():
+            # Experiments without a package manager have no software to
+            # define, so skip them before instantiating their modifiers
             if app_inst.package_manager is None:
                 continue
 
-            compiler_dicts = [app_inst.compilers]
-            for mod_inst in app_inst._modifier_instances:
-                compiler_dicts.append(mod_inst.compilers)
-
-            for compiler_dict in compiler_dicts:
-                for comp, info in compiler_dict.items():
-                    if fnmatch.fnmatch(app_inst.package_manager.name, info["package_manager"]):
-                        if comp not in packages_dict or force:
-                            packages_dict[comp] = syaml.syaml_dict()
-                            packages_dict[comp]["pkg_spec"] = info["pkg_spec"]
-                            ramble.config.add(
-                                f'software:packages:{comp}:pkg_spec:{info["pkg_spec"]}',
-                                scope=self.ws_file_config_scope_name(),
-                            )
-                            if "compiler_spec" in info and info["compiler_spec"]:
-                                packages_dict[comp]["compiler_spec"] = info["compiler_spec"]
-                                config_path = (
-                                    f"software:packages:{comp}:"
-                                    + f'compiler_spec:{info["compiler_spec"]}'
-                                )
-                                ramble.config.add(
-                                    config_path, scope=self.ws_file_config_scope_name()
-                                )
-                            if "compiler" in info and info["compiler"]:
-                                packages_dict[comp]["compiler"] = info["compiler"]
-                                config_path = (
-                                    f"software:packages:{comp}:" + f'compiler:{info["compiler"]}'
-                                )
-                                ramble.config.add(
-                                    config_path, scope=self.ws_file_config_scope_name()
-                                )
-                        elif not quiet and not specs_equiv(info, packages_dict[comp]):
-                            logger.debug(f"  Spec 1: {str(info)}")
-                            logger.debug(f"  Spec 2: {str(packages_dict[comp])}")
-                            raise RambleConflictingDefinitionError(
-                                f"Compiler {comp} would be defined " "in multiple conflicting ways"
-                            )
+            env_name, compilers, software_specs = _experiment_software(app_inst, pm_match)
+
+            for comp, info in compilers:
+                define_package(comp, info, "Compiler")
 
             logger.debug(f"Trying to define packages for {env_name}")
             app_packages = []
@@ -1412,38 +1464,16 @@ ramble:
                 if namespace.packages in environments_dict[env_name]:
                     app_packages = environments_dict[env_name][namespace.packages].copy()
 
-            software_dicts = [app_inst.software_specs]
-            for mod_inst in app_inst._modifier_instances:
-                software_dicts.append(mod_inst.software_specs)
-
-            for software_dict in software_dicts:
-                for spec_name, info in software_dict.items():
-                    if fnmatch.fnmatch(app_inst.package_manager.name, info["package_manager"]):
-                        logger.debug(f"    Found spec: {spec_name}")
-                        if spec_name not in packages_dict or force:
-                            packages_dict[spec_name] = syaml.syaml_dict()
-                            packages_dict[spec_name]["pkg_spec"] = info["pkg_spec"]
-                            if "compiler_spec" in info and info["compiler_spec"]:
-                                packages_dict[spec_name]["compiler_spec"] = info["compiler_spec"]
-                            if "compiler" in info and info["compiler"]:
-                                packages_dict[spec_name]["compiler"] = info["compiler"]
-
-                        elif not quiet and not specs_equiv(info, packages_dict[spec_name]):
-                            logger.debug(f"  Spec 1: {str(info)}")
-                            logger.debug(f"  Spec 2: {str(packages_dict[spec_name])}")
-                            raise RambleConflictingDefinitionError(
-                                f"Package {spec_name} would be defined in multiple "
-                                "conflicting ways"
-                            )
+            for spec_name, info in software_specs:
+                logger.debug(f"    Found spec: {spec_name}")
+                define_package(spec_name, info, "Package")
 
-                        if spec_name not in app_packages:
-                            app_packages.append(spec_name)
+                if spec_name not in app_packages:
+                    app_packages.append(spec_name)
 
             if app_packages:
-                if env_name not in environments_dict:
-                    environments_dict[env_name] = syaml.syaml_dict()
-
-                environments_dict[env_name][namespace.packages] = app_packages.copy()
+                env_entry = environments_dict.setdefault(env_name, {})
+                env_entry[namespace.packages] = app_packages
 
         ramble.config.config.update_config(
             "software", full_software_dict, scope=self.ws_file_config_scope_name()
@@ -1453,8 +1483,7 @@ ramble:
 
     def write_json_results(self):
         out_file = os.path.join(self.root, "results.json")
-        with open(out_file, "w+") as f:
-            sjson.dump(self.results, f)
+        _write_json_results(self.results, out_file)
         return out_file
 
     def default_results(self):
@@ -1479,27 +1508,47 @@ ramble:
             self.results = self.default_results()
 
         self.results["experiments"].append(result)
+        self._results_index.setdefault(result["name"], len(self.results["experiments"]) - 1)
+
+    def _search_result_index(self, exp_name):
+        """Find the position of an experiment in the results list
+
+        Args:
+            exp_name (str): Name of the experiment to search for
+
+        Returns:
+            (int): Index of the experiment's result, or None if it is not found
+        """
+        experiments = self.results["experiments"]
+        index = self._results_index.get(exp_name)
+        if index is not None and index < len(experiments):
+            if experiments[index]["name"] == exp_name:
+                return index
+
+        # The index is stale (e.g. results were replaced), so rebuild it
+        self._results_index = {}
+        for i, exp in enumerate(experiments):
+            self._results_index.setdefault(exp["name"], i)
+        return self._results_index.get(exp_name)
 
     def insert_result(self, result, insert_before_exp):
         """Insert a result before a specified experiment"""
 
-        def search_exp_index(results_list, exp_to_search):
-            for i, exp in enumerate(results_list):
-                if exp["name"] == exp_to_search:
-                    return i
-            return None
-
         if not self.results:
             self.results = self.default_results()
 
-        insert_index = search_exp_index(self.results["experiments"], insert_before_exp)
+        insert_index = self._search_result_index(insert_before_exp)
 
         tty.debug(f"Attempting to insert result before experiment {insert_before_exp}")
         if insert_index is not None:
-            self.results["experiments"].insert(insert_index, result)
+            experiments = self.results["experiments"]
+            experiments.insert(insert_index, result)
+            # Only the results at and after the insertion point moved
+            for i in range(insert_index, len(experiments)):
+                self._results_index[experiments[i]["name"]] = i
         else:
             tty.debug(f"Could not find {insert_before_exp}, appending result to end instead.")
-            self.results["experiments"].append(result)
+            self.append_result(result)
 
     def symlink_result(self, out_file, latest_file):
         """
@@ -1545,100 +1594,54 @@ ramble:
 
             results_written.append(out_file)
 
-            with open(out_file, "w+") as f:
+            # Experiments are formatted and written one at a time, so only a
+            # single experiment's report is held in memory. The large buffer
+            # batches those writes into few syscalls.
+            with _write_tmp_and_replace(out_file, buffering=_results_write_buffer_size) as f:
                 f.write(f"From Workspace: {self.name} (hash: {results['workspace_hash']})\n")
                 if "experiments" in results:
                     for exp in results["experiments"]:
-                        f.write("Experiment %s figures of merit:\n" % exp["name"])
-                        f.write("  Status = %s\n" % exp["RAMBLE_STATUS"])
-                        if "TAGS" in exp:
-                            f.write(f'  Tags = {exp["TAGS"]}\n')
-
-                        if exp["N_REPEATS"] > 0:  # this is a base exp with summary of repeats
-                            for context in exp["CONTEXTS"]:
-                                f.write(f'  {context["display_name"]} figures of merit:\n')
-
-                                fom_summary = {}
-                                for fom in context["foms"]:
-                                    name = fom["name"]
-                                    if name not in fom_summary.keys():
-                                        fom_summary[name] = []
-                                    stat_name = fom["origin_type"]
-                                    value = fom["value"]
-                                    units = fom["units"]
-
-                                    output = f"{stat_name} = {value} {units}\n"
-                                    fom_summary[name].append(output)
-
-                                for fom_name, fom_val_list in fom_summary.items():
-                                    f.write(f"    {fom_name}:\n")
-                                    for fom_val in fom_val_list:
-                                        f.write(f"      {fom_val.strip()}\n")
-
-                            # Print software section if it contains info
-                            if "SOFTWARE" in exp and exp["SOFTWARE"]:
-                                f.write("  Software definitions:\n")
-                                for package_manager, packages in exp["SOFTWARE"].items():
-                                    f.write(f"    {package_manager} packages:\n")
-                                    for pkg in packages:
-                                        f.write(f"      {pkg['name']} @{pkg['version']}\n")
-
-                        else:
-                            for context in exp["CONTEXTS"]:
-                                f.write(f'  {context["display_name"]} figures of merit:\n')
-                                for fom in context["foms"]:
-                                    name = fom["name"]
-                                    if fom["origin_type"] == "modifier":
-                                        delim = "::"
-                                        mod = fom["origin"]
-                                        name = f"{fom['origin_type']}{delim}{mod}{delim}{name}"
-
-                                    output = "{} = {} {}".format(name, fom["value"], fom["units"])
-                                    f.write("    %s\n" % (output.strip()))
-
-                            # Print software section if it contains info
-                            if "SOFTWARE" in exp and exp["SOFTWARE"]:
-                                f.write("  Software definitions:\n")
-                                for package_manager, packages in exp["SOFTWARE"].items():
-                                    f.write(f"    {package_manager} packages:\n")
-                                    for pkg in packages:
-                                        f.write(f"      {pkg['name']} @{pkg['version']}\n")
-
+                        f.writelines(_format_text_result(exp))
                 else:
                     logger.msg("No results to write")
 
-            symlinks_updated.append(latest_file)
-            self.symlink_result(out_file, latest_file)
+            symlinks_updated.append((out_file, latest_file))
 
         if "json" in output_formats:
             file_extension = ".json"
             out_file = os.path.join(self.root, filename_base + file_extension)
             latest_file = os.path.join(self.root, latest_base + file_extension)
             results_written.append(out_file)
-            with open(out_file, "w+") as f:
-                sjson.dump(results, f)
-            symlinks_updated.append(latest_file)
-            self.symlink_result(out_file, latest_file)
+            _write_json_results(results, out_file)
+
+            symlinks_updated.append((out_file, latest_file))
 
         if "yaml" in output_formats:
             file_extension = ".yaml"
             out_file = os.path.join(self.root, filename_base + file_extension)
             latest_file = os.path.join(self.root, latest_base + file_extension)
             results_written.append(out_file)
-            with open(out_file, "w+") as f:
+            with _write_tmp_and_replace(out_file) as f:
                 syaml.dump(results, stream=f)
 
-            symlinks_updated.append(latest_file)
-            self.symlink_result(out_file, latest_file)
+            symlinks_updated.append((out_file, latest_file))
 
         if not results_written:
             logger.die("Results were not written.")
 
+        if ramble.config.get("config:sync_results"):
+            _sync_files(results_written)
+
+        # Only point the latest links at the new results once every format
+        # has been written
+        for out_file, latest_file in symlinks_updated:
+            self.symlink_result(out_file, latest_file)
+
         logger.all_msg("Results are written to:")
         for out_file in results_written:
             logger.all_msg(f"  {out_file}")
         logger.all_msg("Symlinks updated:")
-        for symlink_path in symlinks_updated:
+        for _, symlink_path in symlinks_updated:
             logger.all_msg(f"  {symlink_path}")
 
         if print_results:
@@ -1649,27 +1652,32 @@ ramble:
         return filename_base
 
     def create_mirror(self, mirror_root):
+        # Mirror support is only needed by the mirror command, so defer
+        # importing it until a mirror is created
+        import ramble.mirror
+        import spack.util.url as url_util
+        import spack.util.web as web_util
+
         parsed_url = url_util.parse(mirror_root)
         self.mirror_path = url_util.local_file_path(parsed_url)
         self.mirror_existed = web_util.url_exists(self.mirror_path)
         self.input_mirror_path = os.path.join(self.mirror_path, "inputs")
         self.software_mirror_path = os.path.join(self.mirror_path, "software")
         mirror_dirs = [self.mirror_path, self.input_mirror_path, self.software_mirror_path]
-        for subdir in mirror_dirs:
-            if not os.path.isdir(subdir):
-                try:
-                    fs.mkdirp(subdir)
-                except OSError as e:
-                    raise ramble.mirror.MirrorError(
-                        "Cannot create directory '%s':" % subdir, str(e)
-                    )
-
-        self.software_mirror_stats = MirrorStats()
-        self.input_mirror_stats = MirrorStats()
+        try:
+            for subdir in mirror_dirs:
+                os.makedirs(subdir, exist_ok=True)
+        except OSError as e:
+            raise ramble.mirror.MirrorError("Cannot create directory '%s':" % subdir, str(e))
+
+        self.software_mirror_stats = ramble.mirror.MirrorStats()
+        self.input_mirror_stats = ramble.mirror.MirrorStats()
         self.input_mirror_cache = ramble.caches.MirrorCache(self.input_mirror_path)
         self.software_mirror_cache = ramble.caches.MirrorCache(self.software_mirror_path)
 
     def simplify(self):
+        import ramble.software_environments
+
         # First drop unused experiment templates from app dict so environments aren't rendered
         app_dict = ramble.config.config.get_config(
             namespace.application, scope=self.ws_file_config_scope_name()
@@ -1688,15 +1696,9 @@ ramble:
                 exp = app_inst.expander.experiment_name
 
                 try:
-                    app_dict[app][namespace.workload][wl][namespace.experiment].pop(exp)
-                    if not app_dict[app][namespace.workload][wl][namespace.experiment]:
-                        app_dict[app][namespace.workload][wl].pop(namespace.experiment)
-                    if not app_dict[app][namespace.workload][wl]:
-                        app_dict[app][namespace.workload].pop(wl)
-                    if not app_dict[app][namespace.workload]:
-                        app_dict[app].pop(namespace.workload)
-                    if not app_dict[app]:
-                        app_dict.pop(app)
+                    _prune_config_path(
+                        app_dict, [app, namespace.workload, wl, namespace.experiment, exp]
+                    )
                 except KeyError:
                     continue
 
@@ -1739,16 +1741,22 @@ ramble:
             return self._latest_archive
 
         if os.path.exists(self.archive_dir):
-            archive_dirs = []
-
-            for subdir in os.listdir(self.archive_dir):
-                archive_path = os.path.join(self.archive_dir, subdir)
-                if os.path.isdir(archive_path) and not os.path.islink(archive_path):
-                    archive_dirs.append(archive_path)
-
-            if archive_dirs:
-                latest_path = max(archive_dirs, key=os.path.getmtime)
-                self._latest_archive = os.path.basename(latest_path)
+            # Directory entries carry their type, so symlinks and files are
+            # skipped without additional stat calls, and the newest archive
+            # is tracked while iterating
+            latest_name = None
+            latest_mtime = None
+            with os.scandir(self.archive_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_name = entry.name
+                        latest_mtime = mtime
+
+            if latest_name:
+                self._latest_archive = latest_name
                 return self._latest_archive
 
         return None
@@ -1784,64 +1792,68 @@ ramble:
     @property
     def internal_subdir(self):
         """Subdirectory for housing ramble internals"""
-        return os.path.join(self.root, ".ramble-workspace")
+        return self._cached_path("internal_subdir", self.root, ".ramble-workspace")
 
     @property
     def _transaction_lock_path(self):
         """The location of the lock file used to synchronize multiple
         processes updating the same workspace.
         """
-        return os.path.join(self.internal_subdir, "transaction_lock")
+        return self._cached_path(
+            "_transaction_lock_path", self.internal_subdir, "transaction_lock"
+        )
 
     @property
     def experiment_dir(self):
         """Path to the experiment directory"""
-        return os.path.join(self.root, workspace_experiment_path)
+        return self._cached_path("experiment_dir", self.root, workspace_experiment_path)
 
     @property
     def input_dir(self):
         """Path to the input directory"""
-        return os.path.join(self.root, workspace_input_path)
+        return self._cached_path("input_dir", self.root, workspace_input_path)
 
     @property
     def software_dir(self):
         """Path to the software directory"""
-        return os.path.join(self.root, workspace_software_path)
+        return self._cached_path("software_dir", self.root, workspace_software_path)
 
     @property
     def log_dir(self):
         """Path to the logs directory"""
-        return os.path.join(self.root, workspace_log_path)
+        return self._cached_path("log_dir", self.root, workspace_log_path)
 
     @property
     def config_dir(self):
         """Path to the configuration file directory"""
-        return os.path.join(self.root, workspace_config_path)
+        return self._cached_path("config_dir", self.root, workspace_config_path)
 
     @property
     def auxiliary_software_dir(self):
         """Path to the auxiliary software files directory"""
-        return os.path.join(self.config_dir, auxiliary_software_dir_name)
+        return self._cached_path(
+            "auxiliary_software_dir", self.config_dir, auxiliary_software_dir_name
+        )
 
     @property
     def config_file_path(self):
         """Path to the configuration file directory"""
-        return os.path.join(self.config_dir, config_file_name)
+        return self._cached_path("config_file_path", self.config_dir, config_file_name)
 
     @property
     def archive_dir(self):
         """Path to the archive directory"""
-        return os.path.join(self.root, workspace_archive_path)
+        return self._cached_path("archive_dir", self.root, workspace_archive_path)
 
     @property
     def shared_dir(self):
         """Path to the shared directory"""
-        return os.path.join(self.root, workspace_shared_path)
+        return self._cached_path("shared_dir", self.root, workspace_shared_path)
 
     @property
     def deployments_dir(self):
         """Path to the deployments directory"""
-        return os.path.join(self.root, workspace_deployments_path)
+        return self._cached_path("deployments_dir", self.root, workspace_deployments_path)
 
     @property
     def named_deployment(self):
@@ -1851,7 +1863,9 @@ ramble:
     @property
     def shared_license_dir(self):
         """Path to the shared license directory"""
-        return os.path.join(self.shared_dir, workspace_shared_license_path)
+        return self._cached_path(
+            "shared_license_dir", self.shared_dir, workspace_shared_license_path
+        )
 
     def template_path(self, name):
         if name in self._templates.keys():
@@ -1872,16 +1886,13 @@ ramble:
         workspace_path_replacements = {
             "workspace_root": root,
             "workspace": root,
-            "workspace_configs": os.path.join(root, workspace_config_path),
-            "workspace_software": os.path.join(root, workspace_software_path),
-            "workspace_logs": os.path.join(root, workspace_log_path),
-            "workspace_inputs": os.path.join(root, workspace_input_path),
-            "workspace_experiments": os.path.join(root, workspace_experiment_path),
-            "workspace_shared": os.path.join(root, workspace_shared_path),
-            "workspace_archives": os.path.join(root, workspace_archive_path),
-            "workspace_deployments": os.path.join(root, workspace_deployments_path),
         }
 
+        # Join the separator once, so each subdirectory is a concatenation
+        prefix = os.path.join(root, "")
+        for keyword, subdir in _workspace_subdir_keywords:
+            workspace_path_replacements[keyword] = prefix + subdir
+
         return workspace_path_replacements
 
     def workspace_paths(self):
@@ -1894,9 +1905,7 @@ ramble:
     def add_include(self, new_include):
         """Add a new include to this workspace"""
 
-        if namespace.include not in self.config_sections["workspace"]["yaml"][namespace.ramble]:
-            self.config_sections["workspace"]["yaml"][namespace.ramble][namespace.include] = []
-        includes = self.config_sections["workspace"]["yaml"][namespace.ramble][namespace.include]
+        includes = self._ramble_section().setdefault(namespace.include, [])
         includes.append(new_include)
         self._write_config(config_section)
 
@@ -1909,10 +1918,10 @@ ramble:
                                 Removes all matching includes.
         """
 
-        if namespace.include not in self.config_sections["workspace"]["yaml"][namespace.ramble]:
+        includes = self._ramble_section().get(namespace.include)
+        if includes is None:
             return
 
-        includes = self.config_sections["workspace"]["yaml"][namespace.ramble][namespace.include]
         changed = False
 
         if index is not None:
@@ -1924,15 +1933,11 @@ ramble:
             changed = True
 
         if pattern is not None:
-            remove_indices = []
-            for idx, include in enumerate(includes):
-                if fnmatch.fnmatch(include, pattern):
-                    remove_indices.append(idx)
-
-            for remove_idx in reversed(remove_indices):
-                if remove_idx >= 0 and remove_idx < len(includes):
-                    includes.pop(remove_idx)
-                    changed = True
+            pattern_match = _compile_glob_filters([pattern]).match
+            kept_includes = [include for include in includes if not pattern_match(include)]
+            if len(kept_includes) != len(includes):
+                includes[:] = kept_includes
+                changed = True
 
         if changed:
             self._write_config(config_section)
@@ -1964,24 +1969,28 @@ ramble:
                 config_path, local_replacements=self.workspace_paths()
             )
 
-            # treat relative paths as relative to the environment
+            # treat relative paths as relative to the environment. realpath
+            # already returns a normalized path.
             if not os.path.isabs(config_path):
-                config_path = os.path.join(self.path, config_path)
-                config_path = os.path.normpath(os.path.realpath(config_path))
+                config_path = os.path.realpath(os.path.join(self.path, config_path))
 
-            if os.path.isdir(config_path):
+            # A single stat tells both whether the path exists and its type
+            try:
+                config_path_mode = os.stat(config_path).st_mode
+            except OSError:
+                missing.append(config_path)
+                continue
+
+            if stat.S_ISDIR(config_path_mode):
                 # directories are treated as regular ConfigScopes
                 config_name = f"workspace:{self.name}:{os.path.basename(config_path)}"
                 scope = ramble.config.ConfigScope(config_name, config_path)
-            elif os.path.exists(config_path):
+            else:
                 # files are assumed to be SingleFileScopes
                 config_name = f"workspace:{self.name}:{config_path}"
                 scope = ramble.config.SingleFileScope(
                     config_name, config_path, ramble.schema.merged.schema
                 )
-            else:
-                missing.append(config_path)
-                continue
 
             scopes.append(scope)
 
@@ -2026,15 +2035,15 @@ ramble:
     def _get_application_dict_config(self, key):
         return self.application_configs[key]["yaml"] if key in self.application_configs else None
 
+    def _ramble_section(self):
+        """Return the ramble section of the workspace config file"""
+        return self.config_sections["workspace"]["yaml"][namespace.ramble]
+
     def _get_workspace_section(self, section):
         """Return a dict of a workspace section"""
-        workspace_dict = self._get_workspace_dict()
+        ramble_section = self._ramble_section()
 
-        return (
-            workspace_dict[namespace.ramble][section]
-            if section in workspace_dict[namespace.ramble]
-            else syaml.syaml_dict()
-        )
+        return ramble_section[section] if section in ramble_section else syaml.syaml_dict()
 
     def get_workspace_vars(self):
         """Return a dict of workspace variables"""
@@ -2066,9 +2075,15 @@ ramble:
 
     def get_software_dict(self):
         """Return the software dictionary for this workspace"""
+        software_dict = ramble.config.config.get_config(namespace.software)
+
+        # The merged config is memoized until any scope is mutated, so the
+        # same object means the deprecation checks below have already passed.
+        if software_dict is self._software_dict_cache:
+            return software_dict
+
         # DEPRECATED: Remove once the spack config section is completely removed
         spack_dict = ramble.config.config.get_config("spack")
-        software_dict = ramble.config.config.get_config(namespace.software)
 
         if spack_dict:
             logger.die(
@@ -2084,16 +2099,18 @@ ramble:
                         'Convert this to "pkg_spec" or "spack_pkg_spec" instead.'
                     )
 
+        self._software_dict_cache = software_dict
         return software_dict
 
     def get_applications(self):
         """Get the dictionary of applications"""
         logger.debug("Getting app dict.")
-        logger.debug(f" {self._get_workspace_dict()}")
         workspace_dict = self._get_workspace_dict()
-        if namespace.application not in workspace_dict[namespace.ramble]:
-            workspace_dict[namespace.ramble][namespace.application] = syaml.syaml_dict()
-        return workspace_dict[namespace.ramble][namespace.application]
+        if tty.is_debug():
+            logger.debug(f" {workspace_dict}")
+        return workspace_dict[namespace.ramble].setdefault(
+            namespace.application, syaml.syaml_dict()
+        )
 
     def read_transaction(self):
         """Get a read lock context manager for use in a `with` block."""
@@ -2138,6 +2155,46 @@ def yaml_equivalent(first, second):
         return isinstance(second, str) and first == second
 
 
+def _prune_config_path(config, keys):
+    """Remove the entry at a nested path of a config dict, along with any
+    containers left empty by its removal
+
+    Args:
+        config (dict): Config dict to remove the entry from
+        keys (list): Keys leading to the entry to remove
+
+    Raises:
+        KeyError: If the path does not exist in config
+    """
+    parents = [config]
+    for key in keys[:-1]:
+        parents.append(parents[-1][key])
+    parents[-1].pop(keys[-1])
+
+    # Walk back up, removing containers until one is still populated
+    for parent, key in zip(reversed(parents[:-1]), reversed(keys[:-1])):
+        if parent[key]:
+            break
+        parent.pop(key)
+
+
+def _compile_glob_filters(patterns):
+    """Compile a list of glob patterns into a single regular expression
+
+    The resulting regex matches every string that ``fnmatch.fnmatch`` would
+    match against at least one of the patterns.
+
+    Args:
+        patterns (list(str)): Glob patterns to combine
+
+    Returns:
+        (re.Pattern): Compiled regex. Matches nothing if no patterns are given.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
 def _equiv_list(first, second):
     """Returns whether two ramble yaml lists are equivalent, including overrides"""
     if len(first) != len(second):
@@ -2149,12 +2206,14 @@ def _equiv_dict(first, second):
     """Returns whether two ramble yaml dicts are equivalent, including overrides"""
     if len(first) != len(second):
         return False
-    same_values = all(yaml_equivalent(fv, sv) for fv, sv in zip(first.values(), second.values()))
-    same_keys_with_same_overrides = all(
-        fk == sk and getattr(fk, "override", False) == getattr(sk, "override", False)
-        for fk, sk in zip(first.keys(), second.keys())
-    )
-    return same_values and same_keys_with_same_overrides
+    # Walk both dicts once, comparing the cheap keys before recursing into
+    # values, and stop at the first difference
+    for (fk, fv), (sk, sv) in zip(first.items(), second.items()):
+        if fk != sk or getattr(fk, "override", False) != getattr(sk, "override", False):
+            return False
+        if not yaml_equivalent(fv, sv):
+            return False
+    return True
 
 
 def _read_yaml(str_or_file, schema):
@@ -2191,12 +2250,181 @@ def no_active_workspace():
             activate(ws)
 
 
+def _experiment_software(app_inst, pm_match):
+    """Extract the software an experiment requests from its package manager
+
+    Args:
+        app_inst (ApplicationBase): Experiment instance, with a package manager
+        pm_match (func): Function returning whether a package manager name
+                         matches a package manager pattern
+
+    Returns:
+        (tuple): The experiment's expanded environment name, and lists of
+                 (name, info) tuples for the compilers and software specs
+                 which match its package manager
+    """
+    app_inst.build_modifier_instances()
+    expander = app_inst.expander
+    env_name_str = expander.expansion_str(ramble.keywords.keywords.env_name)
+    env_name = expander.expand_var(env_name_str)
+
+    pm_name = app_inst.package_manager.name
+    sources = [app_inst] + list(app_inst._modifier_instances)
+
+    compilers = []
+    for source in sources:
+        for comp, info in source.compilers.items():
+            if pm_match(pm_name, info["package_manager"]):
+                compilers.append((comp, info))
+
+    software_specs = []
+    for source in sources:
+        for spec_name, info in source.software_specs.items():
+            if pm_match(pm_name, info["package_manager"]):
+                software_specs.append((spec_name, info))
+
+    return env_name, compilers, software_specs
+
+
+@contextlib.contextmanager
+def _write_tmp_and_replace(filename, mode="w", buffering=-1):
+    """Write to a temporary file next to filename, then atomically move it
+    into place, so a partially written file is never visible at filename.
+
+    Args:
+        filename (str): Path of the file to write
+        mode (str): Mode to open the temporary file with
+        buffering (int): Buffering policy for the temporary file, as in open()
+    """
+    tmp = os.path.join(os.path.dirname(filename), f".{os.path.basename(filename)}.tmp")
+    try:
+        with open(tmp, mode, buffering=buffering) as f:
+            yield f
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _sync_files(filenames):
+    """Flush written files to disk, along with the directories holding them
+
+    Syncing after all files have been written, rather than after each one,
+    lets the operating system coalesce the writes before waiting on them.
+
+    Args:
+        filenames (list(str)): Paths of the files to sync
+    """
+    directories = list(dict.fromkeys(os.path.dirname(path) for path in filenames))
+    for path in filenames + directories:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _write_json_results(results, out_file):
+    """Write a results dictionary to a JSON file
+
+    The JSON encoder streams small chunks to the file as it serializes, so
+    they are written through a large buffer rather than building the whole
+    document first.
+
+    Args:
+        results (dict): Results dictionary to write
+        out_file (str): Path of the JSON file to write
+    """
+    with _write_tmp_and_replace(out_file, buffering=_results_write_buffer_size) as f:
+        sjson.dump(results, f)
+
+
+def _format_text_result(exp):
+    """Format the text report for a single experiment's results
+
+    Args:
+        exp (dict): Results of a single experiment
+
+    Returns:
+        (list(str)): Lines of the report, each ending with a newline
+    """
+    lines = []
+    write = lines.append
+    write(f'Experiment {exp["name"]} figures of merit:\n')
+    write(f'  Status = {exp["RAMBLE_STATUS"]}\n')
+    if "TAGS" in exp:
+        write(f'  Tags = {exp["TAGS"]}\n')
+
+    if exp["N_REPEATS"] > 0:  # this is a base exp with summary of repeats
+        for context in exp["CONTEXTS"]:
+            write(f'  {context["display_name"]} figures of merit:\n')
+
+            # Group the formatted summary rows by FOM name
+            fom_summary = defaultdict(list)
+            for fom in context["foms"]:
+                output = f'{fom["origin_type"]} = {fom["value"]} {fom["units"]}'
+                fom_summary[fom["name"]].append(f"      {output.strip()}\n")
+
+            for fom_name, fom_rows in fom_summary.items():
+                write(f"    {fom_name}:\n")
+                lines.extend(fom_rows)
+
+        # Print software section if it contains info
+        if "SOFTWARE" in exp and exp["SOFTWARE"]:
+            write("  Software definitions:\n")
+            for package_manager, packages in exp["SOFTWARE"].items():
+                write(f"    {package_manager} packages:\n")
+                for pkg in packages:
+                    write(f"      {pkg['name']} @{pkg['version']}\n")
+
+    else:
+        for context in exp["CONTEXTS"]:
+            write(f'  {context["display_name"]} figures of merit:\n')
+            for fom in context["foms"]:
+                name = fom["name"]
+                if fom["origin_type"] == "modifier":
+                    delim = "::"
+                    mod = fom["origin"]
+                    name = f"{fom['origin_type']}{delim}{mod}{delim}{name}"
+
+                output = f'{name} = {fom["value"]} {fom["units"]}'
+                write(f"    {output.strip()}\n")
+
+        # Print software section if it contains info
+        if "SOFTWARE" in exp and exp["SOFTWARE"]:
+            write("  Software definitions:\n")
+            for package_manager, packages in exp["SOFTWARE"].items():
+                write(f"    {package_manager} packages:\n")
+                for pkg in packages:
+                    write(f"      {pkg['name']} @{pkg['version']}\n")
+
+    return lines
+
+
 def _filter_results(results, summary_only):
+    """Select the results to write, dropping individual repeats for summaries
+
+    The workspace results are uploaded after being written, so they are never
+    filtered in place. The kept experiments are shared with the original
+    results rather than copied, since the filtered results are only
+    serialized.
+
+    Args:
+        results (dict): Workspace results
+        summary_only (bool): Whether to only keep experiments summarizing repeats
+
+    Returns:
+        (dict): The results to write
+    """
     if not summary_only or "experiments" not in results:
         return results
-    results = copy.deepcopy(results)
-    results["experiments"] = [r for r in results["experiments"] if r["N_REPEATS"] > 0]
-    return results
+    experiments = results["experiments"]
+    if all(r["N_REPEATS"] > 0 for r in experiments):
+        return results
+    filtered = results.copy()
+    filtered["experiments"] = [r for r in experiments if r["N_REPEATS"] > 0]
+    return filtered
 
 
 class RambleWorkspaceError(ramble.error.RambleError):
@@ -205,6 +205,10 @@ def substitute_config_variables(path):
     replaced if there is an active environment, and should only be used in
     environment yaml files.
     """
+    # Nothing to substitute; skip building the replacements
+    if '$' not in path:
+        return path
+
     _replacements = replacements()
     _replacements.pop('env', None)
 
@@ -7,7 +7,9 @@
 Utility functions for parsing, formatting, and manipulating URLs.
 """
 
+import functools
 import re
+import string
 import sys
 
 import urllib.parse
@@ -20,6 +22,26 @@ from spack.util.path import (
 
 is_windows = sys.platform == 'win32'
 
+# Pattern used on every URL parse is compiled once, rather than looked up
+# in the re module's cache on each call.
+_drive_letter_re = re.compile(r'[A-Za-z]:\\')
+
+# URLs with these schemes never refer to local paths
+_remote_url_prefixes = (
+    'http://', 'https://', 'ftp://', 's3://', 'gs://', 'ssh://', 'git://')
+
+# Prefixes of all accepted URLs
+_url_prefixes = ('file://', '/') + _remote_url_prefixes
+
+# NOTE: urllib is told once, at import, to treat s3, gs and oci URLs like http
+# URLs when joining them. This is non-portable, and may be forward
+# incompatible with future cpython versions.
+for _scheme in ('s3', 'gs', 'oci'):
+    if _scheme not in urllib.parse.uses_netloc:
+        urllib.parse.uses_netloc.append(_scheme)
+    if _scheme not in urllib.parse.uses_relative:
+        urllib.parse.uses_relative.append(_scheme)
+
 
 def local_file_path(url):
     """Get a local file path from a url.
@@ -33,7 +55,8 @@ def local_file_path(url):
     if url.scheme == 'file':
         if is_windows:
             pth = convert_to_platform_path(url.netloc + url.path)
-            if re.search(r'^\\[A-Za-z]:', pth):
+            # Escaped drive letter, e.g. \C:\a\b
+            if pth[:1] == '\\' and pth[2:3] == ':' and pth[1:2] in string.ascii_letters:
                 pth = pth.lstrip('\\')
             return pth
         return url.path
@@ -50,6 +73,20 @@ def parse(url, scheme='file'):
     Otherwise, the returned value is the same as urllib's urlparse() with
     allow_fragments=False.
     """
+    # Remote URLs parse the same way every time, so their results are
+    # cached. Local paths depend on the working directory and on path
+    # variables, so they are always parsed.
+    if isinstance(url, str) and url.startswith(_remote_url_prefixes):
+        return _parse_remote(url, scheme)
+    return _parse(url, scheme)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_remote(url, scheme):
+    return _parse(url, scheme)
+
+
+def _parse(url, scheme):
     # guarantee a value passed in is of proper url format. Guarantee
     # allows for easier string manipulation accross platforms
     if isinstance(url, str):
@@ -70,17 +107,21 @@ def parse(url, scheme='file'):
         #     file://C:\\a\\b\\c
         #     file://X:/a/b/c
         path = canonicalize_path(netloc + path)
-        path = re.sub(r'^/+', '/', path)
+        if path.startswith('/'):
+            path = '/' + path.lstrip('/')
         netloc = ''
 
-        drive_ltr_lst = re.findall(r'[A-Za-z]:\\', path)
-        is_win_path = bool(drive_ltr_lst)
-        if is_windows and is_win_path:
+        drive_ltr_lst = _drive_letter_re.findall(path) if is_windows else None
+        if drive_ltr_lst:
             drive_ltr = drive_ltr_lst[0].strip('\\')
-            path = re.sub(r'[\\]*' + drive_ltr, '', path)
+            # Drop every occurrence of the drive letter, along with any
+            # backslashes before it
+            path_parts = path.split(drive_ltr)
+            path = ''.join(
+                [part.rstrip('\\') for part in path_parts[:-1]] + path_parts[-1:])
             netloc = '/' + drive_ltr.strip('\\')
 
-    if sys.platform == "win32":
+    if is_windows:
         path = convert_to_posix_path(path)
 
     return urllib.parse.ParseResult(scheme=scheme,
@@ -116,17 +157,7 @@ def join(base: str, *components: str, resolve_href: bool = False, **kwargs) -> s
         parsed = urllib.parse.urlparse(base)
         if not parsed.path.endswith("/"):
             base = parsed._replace(path=f"{parsed.path}/").geturl()
-    uses_netloc = urllib.parse.uses_netloc
-    uses_relative = urllib.parse.uses_relative
-    try:
-        # NOTE: we temporarily modify urllib internals so s3 and gs schemes are treated like http.
-        # This is non-portable, and may be forward incompatible with future cpython versions.
-        urllib.parse.uses_netloc = [*uses_netloc, "s3", "gs", "oci"]
-        urllib.parse.uses_relative = [*uses_relative, "s3", "gs", "oci"]
-        return urllib.parse.urljoin(base, "/".join(components), **kwargs)
-    finally:
-        urllib.parse.uses_netloc = uses_netloc
-        urllib.parse.uses_relative = uses_relative
+    return urllib.parse.urljoin(base, "/".join(components), **kwargs)
 
 
 git_re = (
@@ -136,8 +167,10 @@ git_re = (
     r"(?(1)(?::([^:/]+))?|:)"   # 4. :<optional port> if scheme else :
     r"(.*[^/])/?$"              # 5. path
 )
+_git_re = re.compile(git_re)
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_git_url(url):
     """Parse git URL into components.
 
@@ -162,7 +195,7 @@ def parse_git_url(url):
 
     Raises ``ValueError`` for invalid URLs.
     """
-    match = re.match(git_re, url)
+    match = _git_re.match(url)
     if not match:
         raise ValueError("bad git URL: %s" % url)
 
@@ -183,14 +216,16 @@ def parse_git_url(url):
 
 
 def require_url_format(url):
-    ut = re.search(r'^(file://|http://|https://|ftp://|s3://|gs://|ssh://|git://|/)', url)
-    if not ut:
+    if not url.startswith(_url_prefixes):
         raise ValueError('Invalid url format from url: %s' % url)
 
 
 def escape_file_url(url):
-    drive_ltr = re.findall(r'[A-Za-z]:\\', url)
-    if is_windows and drive_ltr:
+    if not is_windows:
+        return url
+
+    drive_ltr = _drive_letter_re.findall(url)
+    if drive_ltr:
         url = url.replace(drive_ltr[0], '/' + drive_ltr[0])
 
     return url
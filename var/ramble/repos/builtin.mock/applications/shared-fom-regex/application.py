@@ -0,0 +1,47 @@
+# Copyright 2022-2025 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+from ramble.appkit import *
+
+
+class SharedFomRegex(ExecutableApplication):
+    name = "shared-fom-regex"
+
+    executable(
+        "write-foms",
+        "echo 'first: 1 last: 3'",
+        redirect="log.file",
+        use_mpi=False,
+    )
+
+    workload("test", executable="write-foms")
+
+    # first_fom and last_fom share a regex, middle_fom is defined in between
+    figure_of_merit(
+        "first_fom",
+        fom_regex=r"first: (?P<first>\d+) last: (?P<last>\d+)",
+        group_name="first",
+        log_file="log.file",
+        units="",
+    )
+
+    figure_of_merit(
+        "middle_fom",
+        fom_regex=r"first: (?P<middle>\d+)",
+        group_name="middle",
+        log_file="log.file",
+        units="",
+    )
+
+    figure_of_merit(
+        "last_fom",
+        fom_regex=r"first: (?P<first>\d+) last: (?P<last>\d+)",
+        group_name="last",
+        log_file="log.file",
+        units="",
+    )
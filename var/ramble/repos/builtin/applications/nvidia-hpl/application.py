@@ -13,6 +13,136 @@ from ramble.base_app.builtin.nvidia_hpc_benchmarks import (
     NvidiaHpcBenchmarks as NvidiaHPCBase,
 )
 
+# Workload variables which are exported as the upper case environment
+# variable of the same name. Entries are:
+#   (name, default, values, description, env-var description)
+# where an env-var description of None reuses the variable's description.
+_HPL_ENV_VARS = (
+    (
+        "hpl_fct_comm_policy",
+        "1",
+        ["0", "1"],
+        "Which communication library to use in the panel factorization. 0 = NVSHMEM, 1 = Host MPI",
+        "",
+    ),
+    (
+        "hpl_use_nvshmem",
+        "{int({n_ranks} <= {nvlink_domain_size})}",
+        ["0", "1"],
+        "Whether to use NVSHMEM or not. 0 = Disable, 1 = Enable. "
+        "Defaults to 1 when all ranks fit in one NVLink domain.",
+        "Whether or not to use NVSHMEM",
+    ),
+    (
+        "hpl_p2p_as_bcast",
+        "{4 * ({n_ranks} <= {nvlink_domain_size})}",
+        ["0", "1", "2", "3", "4"],
+        "0 = ncclBcast, 1 = ncclSend/Recv, 2 = CUDA-aware MPI, 3 = host MPI, 4 = NVSHMEM. "
+        "Defaults to 4 when all ranks fit in one NVLink domain, otherwise 0.",
+        "Which communication library to use in the final solve step.",
+    ),
+    (
+        "hpl_nvshmem_swap",
+        "0",
+        ["0", "1"],
+        "Performs row swaps using NVSHMEM instead of NCCL. 0 = Disable, 1 = Enable.",
+        None,
+    ),
+    (
+        "hpl_chunk_size_nbs",
+        "16",
+        None,
+        "Number of matrix blocks to group for computations. Needs to be > 0",
+        None,
+    ),
+    (
+        "hpl_dist_trsm_flag",
+        "1",
+        ["0", "1"],
+        "Perform the solve step (TRSM) in parallel, rather than on only the ranks that own part of the matrix.",
+        None,
+    ),
+    (
+        "hpl_cta_per_fct",
+        "16",
+        None,
+        "Sets the number of CTAs (thread blocks) for factorization. Needs to be > 0.",
+        None,
+    ),
+    (
+        "hpl_alloc_hugepages",
+        "1",
+        ["0", "1"],
+        "Use 2MB hugepages for host-side allocations. Done through the madvise syscall, "
+        "so it has no effect if transparent hugepages are disabled.",
+        None,
+    ),
+    (
+        "warmup_end_prog",
+        "5",
+        None,
+        "Runs the main loop once before the 'real' run. Stops the warmup at x%. Values can be 1 - 100.",
+        None,
+    ),
+    ("test_loops", "1", None, "Runs the main loop X many times", None),
+    (
+        "hpl_cusolver_mp_tests",
+        "1",
+        None,
+        "Runs several tests of individual components of HPL (GEMMS, comms, etc.)",
+        None,
+    ),
+    (
+        "hpl_cusolver_mp_tests_gemm_iters",
+        "128",
+        None,
+        "Number of repeat GEMM calls in tests. Needs to be > 0.",
+        None,
+    ),
+    (
+        "hpl_ooc_mode",
+        "0",
+        None,
+        "Enables / disables out-of-core mode",
+        None,
+    ),
+    (
+        "hpl_ooc_max_gpu_mem",
+        "-1",
+        None,
+        "Limits the amount of GPU memory used for OOC. In GiB. Needs to be >= -1.",
+        None,
+    ),
+    (
+        "hpl_ooc_tile_m",
+        "4096",
+        None,
+        "Row blocking factor. Needs to be > 0",
+        None,
+    ),
+    (
+        "hpl_ooc_tile_n",
+        "4096",
+        None,
+        "Column blocking factor. Needs to be > 0",
+        None,
+    ),
+    (
+        "hpl_ooc_num_streams",
+        "3",
+        None,
+        "Number of streams used for OOC operations",
+        None,
+    ),
+    (
+        "hpl_ooc_safe_size",
+        "2.0",
+        None,
+        "GPU memory (in GiB) needed for driver. This amount will not be used by HPL OOC",
+        None,
+    ),
+)
+
 
 class NvidiaHpl(HplBase, NvidiaHPCBase):
     """This application defines how to run NVIDIA's optimized version of HPL,
@@ -54,244 +184,30 @@ class NvidiaHpl(HplBase, NvidiaHPCBase):
     )
 
     workload_variable(
-        "hpl_fct_comm_policy",
-        default="1",
-        values=["0", "1"],
-        description="Which communication library to use in the panel factorization. 0 = NVSHMEM, 1 = Host MPI",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_FCT_COMM_POLICY",
-        "{hpl_fct_comm_policy}",
-        description="",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_use_nvshmem",
-        default="0",
-        values=["0", "1"],
-        description="Whether to use NVSHMEM or not. 0 = Disable, 1 = Enable.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_USE_NVSHMEM",
-        "{hpl_use_nvshmem}",
-        description="Whether or not to use NVSHMEM",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_p2p_as_bcast",
-        default="0",
-        values=["0", "1", "2", "3", "4"],
-        description="0 = ncclBcast, 1 = ncclSend/Recv, 2 = CUDA-aware MPI, 3 = host MPI, 4 = NVSHMEM",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_P2P_AS_BCAST",
-        "{hpl_p2p_as_bcast}",
-        description="Which communication library to use in the final solve step.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_nvshmem_swap",
-        default="0",
-        values=["0", "1"],
-        description="Performs row swaps using NVSHMEM instead of NCCL. 0 = Disable, 1 = Enable.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_NVSHMEM_SWAP",
-        "{hpl_nvshmem_swap}",
-        description="Performs row swaps using NVSHMEM instead of NCCL. 0 = Disable, 1 = Enable.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_chunk_size_nbs",
-        default="16",
-        description="Number of matrix blocks to group for computations. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_CHUNK_SIZE_NBS",
-        "{hpl_chunk_size_nbs}",
-        description="Number of matrix blocks to group for computations. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_dist_trsm_flag",
-        default="1",
-        values=["0", "1"],
-        description="Perform the solve step (TRSM) in parallel, rather than on only the ranks that own part of the matrix.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_DIST_TRSM_FLAG",
-        "{hpl_dist_trsm_flag}",
-        description="Perform the solve step (TRSM) in parallel, rather than on only the ranks that own part of the matrix.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_cta_per_fct",
-        default="16",
-        description="Sets the number of CTAs (thread blocks) for factorization. Needs to be > 0.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_CTA_PER_FCT",
-        "{hpl_cta_per_fct}",
-        description="Sets the number of CTAs (thread blocks) for factorization. Needs to be > 0.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_alloc_hugepages",
-        default="0",
-        values=["0", "1"],
-        description="Use 2MB hugepages for host-side allocations. Done through the madvise syscall.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_ALLOC_HUGEPAGES",
-        "{hpl_alloc_hugepages}",
-        description="Use 2MB hugepages for host-side allocations. Done through the madvise syscall.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "warmup_end_prog",
-        default="5",
-        description="Runs the main loop once before the 'real' run. Stops the warmup at x%. Values can be 1 - 100.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "WARMUP_END_PROG",
-        "{warmup_end_prog}",
-        description="Runs the main loop once before the 'real' run. Stops the warmup at x%. Values can be 1 - 100.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "test_loops",
-        default="1",
-        description="Runs the main loop X many times",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "TEST_LOOPS",
-        "{test_loops}",
-        description="Runs the main loop X many times",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_cusolver_mp_tests",
-        default="1",
-        description="Runs several tests of individual components of HPL (GEMMS, comms, etc.)",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_CUSOLVER_MP_TESTS",
-        "{hpl_cusolver_mp_tests}",
-        description="Runs several tests of individual components of HPL (GEMMS, comms, etc.)",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_cusolver_mp_tests_gemm_iters",
-        default="128",
-        description="Number of repeat GEMM calls in tests. Needs to be > 0.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_CUSOLVER_MP_TESTS_GEMM_ITERS",
-        "{hpl_cusolver_mp_tests_gemm_iters}",
-        description="Number of repeat GEMM calls in tests. Needs to be > 0.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_mode",
+        "nvlink_domain_size",
         default="0",
-        description="Enables / disales out-of-core mode",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_MODE",
-        "{hpl_ooc_mode}",
-        description="Enables / disales out-of-core mode",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_max_gpu_mem",
-        default="-1",
-        description="Limits the amount of GPU memory used for OOC. In GiB. Needs to be >= -1.",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_MAX_GPU_MEM",
-        "{hpl_ooc_max_gpu_mem}",
-        description="Limits the amount of GPU memory used for OOC. In GiB. Needs to be >= -1.",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_tile_m",
-        default="4096",
-        description="Row blocking factor. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_TILE_M",
-        "{hpl_ooc_tile_m}",
-        description="Row blocking factor. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_tile_n",
-        default="4096",
-        description="Column blocking factor. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_TILE_N",
-        "{hpl_ooc_tile_n}",
-        description="Column blocking factor. Needs to be > 0",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_num_streams",
-        default="3",
-        description="Number of streams used for OCC operations",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_NUM_STREAMS",
-        "{hpl_ooc_num_streams}",
-        description="Number of streams used for OCC operations",
-        workload_group="all_workloads",
-    )
-
-    workload_variable(
-        "hpl_ooc_safe_size",
-        default="2.0",
-        description="GPU memory (in GiB) needed for driver. This amount will not be used by HPL OCC",
-        workload_group="all_workloads",
-    )
-    environment_variable(
-        "HPL_OOC_SAFE_SIZE",
-        "{hpl_ooc_safe_size}",
-        description="GPU memory (in GiB) needed for driver. This amount will not be used by HPL OCC",
-        workload_group="all_workloads",
-    )
+        description="Number of ranks that fit in a single NVLink domain. Experiments whose "
+        "ranks all fit in one domain default to NVSHMEM for the final solve broadcast. "
+        "0 = Unknown, always use NCCL.",
+        workload_group="all_workloads",
+    )
+
+    for var_name, var_default, var_values, var_desc, env_desc in _HPL_ENV_VARS:
+        workload_variable(
+            var_name,
+            default=var_default,
+            values=var_values,
+            description=var_desc,
+            workload_group="all_workloads",
+        )
+        environment_variable(
+            var_name.upper(),
+            "{" + var_name + "}",
+            description=var_desc if env_desc is None else env_desc,
+            workload_group="all_workloads",
+        )
+    # Keep the loop variables from becoming class attributes
+    del var_name, var_default, var_values, var_desc, env_desc
 
     workload_variable(
         "block_size",
@@ -302,7 +218,7 @@ class NvidiaHpl(HplBase, NvidiaHPCBase):
 
     figure_of_merit(
         "Per GPU GFlops",
-        fom_regex=r".*\s+(?P<N>[0-9]+)\s+(?P<NB>[0-9]+)\s+(?P<P>[0-9]+)"
+        fom_regex=r".*\s(?P<N>[0-9]+)\s+(?P<NB>[0-9]+)\s+(?P<P>[0-9]+)"
         + r"\s+(?P<Q>[0-9]+)\s+(?P<time>[0-9]+\.[0-9]+)\s+"
         + r"(?P<gflops>\S+)\s+\(\s+(?P<per_gpu_gflops>\S+)\)",
         group_name="per_gpu_gflops",
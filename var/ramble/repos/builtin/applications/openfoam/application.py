@@ -74,10 +74,10 @@ class Openfoam(OpenfoamBase):
         default="PATH,LD_LIBRARY_PATH,FOAM_API,FOAM_APP,FOAM_APPBIN,FOAM_ETC,"
         + "FOAM_LIBBIN,FOAM_MPI,FOAM_RUN,FOAM_SITE_APPBIN,FOAM_SITE_LIBBIN,"
         + "FOAM_SOLVERS,FOAM_SRC,FOAM_TUTORIALS,FOAM_USER_APPBIN,"
-        + "FOAM_USER_LIBBIN,FOAM_UTILITIES,LD_LIBRARY_PATH,PATH,"
-        + "WM_ARCH,WM_COMPILER,WM_COMPILER_LIB_ARCH,WM_COMPILER_TYPE,"
-        + "WM_COMPILE_OPTION,WM_DIR,WM_LABEL_OPTION,WM_LABEL_SIZE,"
-        + "WM_MPLIB,WM_OPTIONS,WM_PRECISION_OPTION,WM_PROJECT,WM_PROJECT_DIR,"
-        + "WM_PROJECT_USER_DIR,WM_PROJECT_VERSION,WM_THIRD_PARTY_DIR",
+        + "FOAM_USER_LIBBIN,FOAM_UTILITIES,WM_ARCH,WM_COMPILER,"
+        + "WM_COMPILER_LIB_ARCH,WM_COMPILER_TYPE,WM_COMPILE_OPTION,WM_DIR,"
+        + "WM_LABEL_OPTION,WM_LABEL_SIZE,WM_MPLIB,WM_OPTIONS,"
+        + "WM_PRECISION_OPTION,WM_PROJECT,WM_PROJECT_DIR,WM_PROJECT_USER_DIR,"
+        + "WM_PROJECT_VERSION,WM_THIRD_PARTY_DIR",
         workloads=["*"],
     )
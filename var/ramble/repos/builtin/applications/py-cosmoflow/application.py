@@ -329,7 +329,7 @@ class PyCosmoflow(ExecutableApplication):
 
         # Set config options in config_data
         for var_name in self.variables:
-            if "." in var_name and len(var_name.split(".")) > 1:
+            if "." in var_name:
                 var_val = self.expander.expand_var(
                     self.expander.expansion_str(var_name), typed=True
                 )
@@ -340,10 +340,10 @@ class PyCosmoflow(ExecutableApplication):
                         self.expander.expansion_str(var_name)
                     )
                 elif isinstance(var_val, list):
-                    for i in range(0, len(var_val)):
-                        var_val[i] = self.expander.expand_var(
-                            var_val[i], typed=True
-                        )
+                    var_val = [
+                        self.expander.expand_var(val, typed=True)
+                        for val in var_val
+                    ]
 
                 ramble.util.yaml_generation.set_config_value(
                     config_data, var_name, var_val, force=True
@@ -356,18 +356,16 @@ class PyCosmoflow(ExecutableApplication):
             self.expander.expand_var_name("output_dir"),
         )
 
-        # Create string of yaml data.
-        config_str = yaml.dump(
-            config_data,
-            default_flow_style=False,
-            width=syaml.maxint,
-            Dumper=syaml.OrderedLineDumper,
-        )
-
         # Write out experiment config
         config_path = canonicalize_path(
             self.expander.expand_var("{cosmoflow_config}"),
         )
 
         with open(config_path, "w+") as f:
-            f.write(config_str)
+            yaml.dump(
+                config_data,
+                f,
+                default_flow_style=False,
+                width=syaml.maxint,
+                Dumper=syaml.OrderedLineDumper,
+            )
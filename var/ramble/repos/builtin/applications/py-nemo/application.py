@@ -549,7 +549,7 @@ class PyNemo(ExecutableApplication):
 
         # Set config options in config_data
         for var_name in self.variables:
-            if "." in var_name and len(var_name.split(".")) > 1:
+            if "." in var_name:
                 var_val = self.expander.expand_var(
                     self.expander.expansion_str(var_name), typed=True
                 )
@@ -560,10 +560,10 @@ class PyNemo(ExecutableApplication):
                         self.expander.expansion_str(var_name)
                     )
                 elif isinstance(var_val, list):
-                    for i in range(0, len(var_val)):
-                        var_val[i] = self.expander.expand_var(
-                            var_val[i], typed=True
-                        )
+                    var_val = [
+                        self.expander.expand_var(val, typed=True)
+                        for val in var_val
+                    ]
 
                 ramble.util.yaml_generation.set_config_value(
                     config_data, var_name, var_val, force=True
@@ -571,7 +571,7 @@ class PyNemo(ExecutableApplication):
 
         # Remove requested options
         for var_name in remove_vars:
-            if "." in var_name and len(var_name.split(".")) > 1:
+            if "." in var_name:
                 ramble.util.yaml_generation.remove_config_value(
                     config_data, var_name
                 )
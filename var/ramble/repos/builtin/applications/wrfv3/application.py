@@ -58,7 +58,7 @@ class Wrfv3(ExecutableApplication):
     executable(
         "copy",
         template=[
-            "cp -R {input_path}/* {experiment_run_dir}/.",
+            "cp {input_copy_flags} {input_path}/* {experiment_run_dir}/.",
             "ln -s {wrf_path}/run/* {experiment_run_dir}/.",
         ],
         use_mpi=False,
@@ -92,6 +92,16 @@ class Wrfv3(ExecutableApplication):
         workloads=["CONUS_2p5km"],
     )
 
+    workload_variable(
+        "input_copy_flags",
+        default="-R",
+        values=["-R", "-lR"],
+        description="Flags used to copy inputs into each experiment. "
+        "'-lR' hardlinks the inputs instead of copying them, which requires "
+        "the inputs and experiments to be on the same filesystem.",
+        workloads=["CONUS_12km", "CONUS_2p5km"],
+    )
+
     log_str = os.path.join(
         Expander.expansion_str("experiment_run_dir"), "stats.out"
     )
@@ -174,8 +184,10 @@ class Wrfv3(ExecutableApplication):
         )
 
         if file_list:
+            # Searched for across whole files, so whitespace before the time
+            # must not cross a line boundary
             timing_regex = re.compile(
-                r"Timing for main.*:\s+(?P<main_time>[0-9]+\.[0-9]*).*"
+                r"Timing for main.*:[^\S\n]+(?P<main_time>[0-9]+\.[0-9]*)"
             )
             avg_time = 0.0
             min_time = float("inf")
@@ -184,14 +196,17 @@ class Wrfv3(ExecutableApplication):
             count = 0
             for out_file in file_list:
                 with open(out_file) as f:
-                    for line in f.readlines():
-                        m = timing_regex.match(line)
-                        if m:
-                            time = float(m.group("main_time"))
-                            count += 1
-                            sum_time += time
-                            min_time = min(min_time, time)
-                            max_time = max(max_time, time)
+                    data = f.read()
+                for m in timing_regex.finditer(data):
+                    # Only timings at the start of a line are counted
+                    start = m.start()
+                    if start and data[start - 1] != "\n":
+                        continue
+                    time = float(m.group("main_time"))
+                    count += 1
+                    sum_time += time
+                    min_time = min(min_time, time)
+                    max_time = max(max_time, time)
 
             avg_time = sum_time / max(count, 1)
 
@@ -455,6 +455,9 @@ class Openfoam(ExecutableApplication):
             ","
         )
 
+        # Export each variable once, keeping the first occurrence's position
+        export_vars = dict.fromkeys(export_vars)
+
         export_args = []
         for var in export_vars:
             export_args.append(f"{export_prefix} {var}")